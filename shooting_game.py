@@ -8,15 +8,21 @@ Run: python shooting_game.py (depends on pygame)
 """
 
 import math
-import random
+import numpy as np
 import pygame
 from dataclasses import dataclass
 from typing import List, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain Python
+    njit = None
 # -----------------------------
 # Config
 # -----------------------------
 WIDTH, HEIGHT = 900, 600
-FPS = 120
+RENDER_FPS = 60  # display tick; most monitors cap at 60 Hz anyway
+SIM_DT = 1.0 / 60.0  # fixed simulation timestep, decoupled from rendering
 
 # Gameplay tuning
 TARGET_MIN_RADIUS = 16
@@ -27,6 +33,9 @@ SPAWN_INTERVAL_MIN = 0.35
 SPAWN_ACCEL_EVERY = 5  # every N seconds, decrease spawn interval a bit
 SPAWN_ACCEL_STEP = 0.04
 MAX_TARGETS_ON_SCREEN = 7
+# Spatial-hash cell size for click hit-testing; a cell spans one max-size
+# target, so a click only needs the clicked cell plus its 8 neighbors
+GRID_CELL = TARGET_MAX_RADIUS * 2
 
 MISS_SCORE = -5
 TIMEOUT_SCORE = -3
@@ -34,6 +43,11 @@ TIMEOUT_SCORE = -3
 RING_SCORES = (10, 5, 1)
 # Fractions of target radius that define the rings (ascending)
 RING_FRACS = (0.25, 0.55, 1.00)
+RING_FRACS_SQ = np.array([f * f for f in RING_FRACS], dtype=np.float32)
+
+# Timeout-arc quantization: progress is rounded down to one of this many
+# pre-rendered frames per radius (pygame.draw.arc is slow per frame)
+ARC_FRAMES = 32
 
 ROUND_TIME = 15  # seconds; set to None for endless
 
@@ -49,24 +63,35 @@ MUTED = (120, 130, 145)
 # -----------------------------
 # Data structures
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class Target:
     """
     Circular target entity
     Attributes:
     x, y (float): Center coordinates (pixels)
     r (float): Radius
-    spawn_time (float): Spawn time (seconds)
-    lifetime (float): Lifetime (seconds)
+    spawn_time_ms (int): Spawn time (milliseconds, pygame.time.get_ticks)
+    lifetime_ms (int): Lifetime (milliseconds)
     vx, vy (float): Velocity (can be 0 to indicate rest)
     """
     x: float
     y: float
     r: float
-    spawn_time: float
-    lifetime: float
+    spawn_time_ms: int
+    lifetime_ms: int
+    # Squared ring radii, cached at construction so hit tests never re-square
+    r2_in: float = 0.0
+    r2_mid: float = 0.0
+    r2_out: float = 0.0
+
+    def __post_init__(self):
+        r2 = self.r * self.r
+        self.r2_in = r2 * RING_FRACS[0] ** 2
+        self.r2_mid = r2 * RING_FRACS[1] ** 2
+        self.r2_out = r2 * RING_FRACS[2] ** 2
+
     def contains(self, px: float, py: float) -> bool:
-        return (self.x - px) ** 2 + (self.y - py) ** 2 <= self.r ** 2
+        return (self.x - px) ** 2 + (self.y - py) ** 2 <= self.r2_out
 
 # -----------------------------
 # Utility
@@ -74,6 +99,48 @@ class Target:
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))#limitation
 
+# -----------------------------
+# Hot kernels (numba-compiled when available)
+# -----------------------------
+def expire_targets(t_spawn, t_life, n, now_ms, alive_out):
+    """Fill alive_out[:n] with the survival mask; return the survivor count."""
+    count = 0
+    for i in range(n):
+        a = now_ms - t_spawn[i] <= t_life[i]
+        alive_out[i] = a
+        if a:
+            count += 1
+    return count
+
+def find_hit(tx, ty, t_r2, cand, mx, my):
+    """Closest candidate slot containing (mx, my) and its ring index.
+
+    Returns (-1, -1) when the click lands outside every candidate.
+    """
+    best = -1
+    best_d2 = 1e18
+    for j in range(cand.shape[0]):
+        i = cand[j]
+        dx = tx[i] - mx
+        dy = ty[i] - my
+        d2 = dx * dx + dy * dy
+        if d2 <= t_r2[i, 2] and d2 < best_d2:
+            best = i
+            best_d2 = d2
+    if best < 0:
+        return -1, -1
+    ring = 0  # bullseye
+    if best_d2 > t_r2[best, 0]:
+        ring = 1  # middle
+    if best_d2 > t_r2[best, 1]:
+        ring = 2  # outer
+    return best, ring
+
+if njit is not None:
+    expire_targets = njit(cache=True, fastmath=True)(expire_targets)
+    find_hit = njit(cache=True, fastmath=True)(find_hit)
+
+
 # -----------------------------
 # Game
 # -----------------------------
@@ -81,22 +148,119 @@ class Game:
     """Game main loop and state management: event processing → logic update → screen rendering."""
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
+        # Batched blitting: pygame-CE's fblits does the loop in C without
+        # per-blit rect bookkeeping; stock pygame's blits is the fallback
+        self._blit_batch = getattr(screen, "fblits", None) or screen.blits
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.SysFont("consolas", 18)
         self.font_med = pygame.font.SysFont("consolas", 24, bold=True)
         self.font_big = pygame.font.SysFont("consolas", 46, bold=True)
         self.crosshair_radius = 12
         self.crosshair_gap = 4
+        # Static backdrop (BG fill + HUD chrome), blitted region-by-region
+        # to erase dirty rects; the HUD bar never changes, only its text
+        self.background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.background.fill(BG)
+        pygame.draw.rect(self.background, (20, 24, 32), (0, 0, WIDTH, 36))
+        pygame.draw.line(self.background, (40, 46, 58), (0, 36), (WIDTH, 36), 1)
+        # Target sprite atlas: one pre-rendered bullseye per integer radius,
+        # so per-frame ring drawing becomes a single alpha blit
+        self._target_sprites: dict = {}
+        for r in range(TARGET_MIN_RADIUS, TARGET_MAX_RADIUS + 1):
+            size = 2 * r + 6
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            c = size // 2
+            pygame.draw.circle(s, WHITE, (c, c), r, 2)
+            pygame.draw.circle(s, CYAN, (c, c), int(r * 0.55), 2)
+            pygame.draw.circle(s, WHITE, (c, c), int(r * 0.25), 0)
+            self._target_sprites[r] = s.convert_alpha()
+        # Timeout-arc atlas: ARC_FRAMES pre-rendered sweep angles per radius;
+        # the fade is applied per blit with set_alpha instead of re-drawing
+        self._arc_atlas: dict = {}
+        for r in range(TARGET_MIN_RADIUS, TARGET_MAX_RADIUS + 1):
+            size = 2 * r + 8
+            c = size // 2
+            arc_rect = (c - (r + 2), c - (r + 2), (r + 2) * 2, (r + 2) * 2)
+            frames = []
+            for k in range(ARC_FRAMES):
+                s = pygame.Surface((size, size), pygame.SRCALPHA)
+                if k:
+                    end_angle = -math.pi / 2 + 2 * math.pi * (k / ARC_FRAMES)
+                    pygame.draw.arc(s, (255, 80, 80), arc_rect,
+                                    -math.pi / 2, end_angle, 3)
+                frames.append(s.convert_alpha())
+            self._arc_atlas[r] = frames
+        # Crosshair sprite: the shape never changes, only its position
+        r = self.crosshair_radius
+        g = self.crosshair_gap
+        size = 2 * r + 4
+        c = size // 2
+        s = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.line(s, YELLOW, (c - r, c), (c - g, c), 2)
+        pygame.draw.line(s, YELLOW, (c + g, c), (c + r, c), 2)
+        pygame.draw.line(s, YELLOW, (c, c - r), (c, c - g), 2)
+        pygame.draw.line(s, YELLOW, (c, c + g), (c, c + r), 2)
+        pygame.draw.circle(s, YELLOW, (c, c), 2)
+        self.crosshair_surf = s.convert_alpha()
+        # Score popups only ever show a handful of fixed strings
+        # (+10/+5/+1, miss, timeout); rasterize them once up front
+        self._float_cache: dict = {}
+        pairs = [(f"+{s}", c) for s, c in zip(RING_SCORES, (GREEN, CYAN, WHITE))]
+        pairs.append((str(MISS_SCORE), RED))
+        pairs.append((f"-{abs(TIMEOUT_SCORE)}", RED))
+        for text, color in pairs:
+            self._float_cache[(text, color)] = \
+                self.font_med.render(text, True, color).convert_alpha()
+        # Rendered-text cache: font.render is slow and most strings repeat
+        # frame after frame (HUD labels, overlays, score popups)
+        self._text_cache: dict = {}
         self.reset()
 
+    def _text(self, font, s, color):
+        """font.render with a small bounded cache keyed by (font, s, color)."""
+        key = (id(font), s, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) > 64:
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(s, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def reset(self):
         self.running = True
         self.playing = False  # start screen first
         self.paused = False
-        self.targets: List[Target] = []
-        self.spawn_interval = SPAWN_INTERVAL_START
-        self.last_spawn = 0.0
-        self.start_time = 0.0
+        # Targets live in parallel arrays (structure-of-arrays): slot i of every
+        # array describes one target, and only the first n_targets slots are live.
+        self.tx = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.float32)
+        self.ty = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.float32)
+        self.tr = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.float32)
+        self.t_spawn = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.int32)   # ms ticks
+        self.t_life = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.int32)    # ms
+        # Cached squared ring radii per slot, ascending (bullseye / middle /
+        # outer) so a searchsorted on the row yields the ring index directly
+        self.t_r2 = np.zeros((MAX_TARGETS_ON_SCREEN, 3), dtype=np.float32)
+        # All columns together, for compaction / removal loops
+        self._t_cols = (self.tx, self.ty, self.tr, self.t_spawn, self.t_life,
+                        self.t_r2)
+        self.n_targets = 0
+        # Scratch survival mask for the expire kernel
+        self._alive_buf = np.zeros(MAX_TARGETS_ON_SCREEN, dtype=np.bool_)
+        # Spatial hash: (cell_x, cell_y) -> list of live slot indices
+        self._grid: dict = {}
+        # Per-slot render state (arc progress / fade alpha), refreshed by
+        # the fused pass in update so draw never recomputes ages
+        self._render_progress = np.zeros(0, dtype=np.float32)
+        self._render_alpha = np.zeros(0, dtype=np.int32)
+        # Times below are integer milliseconds from pygame.time.get_ticks();
+        # only `elapsed` (for the round clock) is kept in float seconds
+        self.spawn_interval_ms = int(SPAWN_INTERVAL_START * 1000)
+        self.last_spawn_ms = 0
+        self.start_time_ms = 0
+        # Difficulty stepping state (set for real in start_round)
+        self._next_accel_time_ms = 0
+        self._accel_step = 0
         self.elapsed = 0.0
         # Stats
         self.score = 0
@@ -104,19 +268,36 @@ class Game:
         self.misses = 0
         self.timeouts = 0
         self.best_score = 0
+        # Bulk-generated uniform [0, 1) floats; one NumPy fill is far
+        # cheaper than repeated random.uniform calls at spawn time
+        self._rng = np.random.default_rng()
+        self._rand_pool = self._rng.random(4096)
+        self._rand_idx = 0
         # Floating texts: (text, color, x, y, birth_time)
         self.floating_texts: List[Tuple[str, Tuple[int,int,int], float, float, float]] = []
+        # Dirty-rect bookkeeping: rects drawn last frame (to erase) and the
+        # full list to pass to display.update. Start with a full-screen rect.
+        self.prev_dirty: List[pygame.Rect] = [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+        self._update_rects: List[pygame.Rect] = [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+        # Crosshair rect from the last frame (tracked outside prev_dirty so
+        # the idle fast path in run() can move just the crosshair), and the
+        # static-scene snapshot that makes that fast path possible
+        self._cross_rect = None
+        self._idle_frame = None
 
     # -------------------------
     # Core loop
     # -------------------------
-    def start_round(self, now):
+    def start_round(self, now_ms):
         """Start a new round: reset statistics and timer, clear targets, and cancel pause."""
         self.playing = True
-        self.targets.clear()
-        self.spawn_interval = SPAWN_INTERVAL_START
-        self.last_spawn = now
-        self.start_time = now
+        self.n_targets = 0
+        self._grid.clear()
+        self.spawn_interval_ms = int(SPAWN_INTERVAL_START * 1000)
+        self._next_accel_time_ms = now_ms + int(SPAWN_ACCEL_EVERY * 1000)
+        self._accel_step = 0
+        self.last_spawn_ms = now_ms
+        self.start_time_ms = now_ms
         self.elapsed = 0.0
         self.score = 0
         self.hits = 0
@@ -124,84 +305,144 @@ class Game:
         self.timeouts = 0
         self.floating_texts.clear()
 
-    def update(self, dt, now):
+    def update(self, dt, now_ms):
         """Updates the game state (spawning/expiring targets, scoring, round timeout, etc.)"""
         if not self.playing:
             return
         if self.paused:
             return
-        self.elapsed = now - self.start_time
-
-        # Difficulty: speed up spawns periodically
-        if SPAWN_ACCEL_EVERY and self.elapsed > 0:
-            steps = int(self.elapsed // SPAWN_ACCEL_EVERY)
-            self.spawn_interval = clamp(
-                SPAWN_INTERVAL_START - steps * SPAWN_ACCEL_STEP,
-                SPAWN_INTERVAL_MIN,
-                SPAWN_INTERVAL_START,
+        # seconds, computed once per frame for the round clock
+        self.elapsed = (now_ms - self.start_time_ms) * 0.001
+
+        # Difficulty: speed up spawns periodically (event-driven, so the
+        # recompute only happens once per accel step, not every frame)
+        if SPAWN_ACCEL_EVERY and now_ms >= self._next_accel_time_ms:
+            self._accel_step += 1
+            self.spawn_interval_ms = max(
+                int(SPAWN_INTERVAL_MIN * 1000),
+                int((SPAWN_INTERVAL_START - self._accel_step * SPAWN_ACCEL_STEP) * 1000),
             )
+            self._next_accel_time_ms += int(SPAWN_ACCEL_EVERY * 1000)
 
         # Spawn targets
-        if (now - self.last_spawn >= self.spawn_interval
-            and len(self.targets) < MAX_TARGETS_ON_SCREEN):
-            self.spawn_target(now)
-            self.last_spawn = now
-
-        # Expire targets
-        alive = []
-        for t in self.targets:
-            if now - t.spawn_time > t.lifetime:
-                self.score += TIMEOUT_SCORE
-                self.timeouts += 1
-                self.make_float_text(f"-{abs(TIMEOUT_SCORE)}", RED, t.x, t.y, now)
-            else:
-                alive.append(t)
-        self.targets = alive
+        if (now_ms - self.last_spawn_ms >= self.spawn_interval_ms
+            and self.n_targets < MAX_TARGETS_ON_SCREEN):
+            self.spawn_target(now_ms)
+            self.last_spawn_ms = now_ms
+
+        # Expire targets through the compiled kernel, then refresh the
+        # fused render state (arc progress / fade alpha) for the survivors
+        n = self.n_targets
+        if n:
+            new_n = int(expire_targets(self.t_spawn, self.t_life, n, now_ms,
+                                       self._alive_buf))
+            if new_n < n:
+                alive = self._alive_buf[:n]
+                expired = n - new_n
+                self.score += TIMEOUT_SCORE * expired
+                self.timeouts += expired
+                for x, y in zip(self.tx[:n][~alive], self.ty[:n][~alive]):
+                    self.make_float_text(f"-{abs(TIMEOUT_SCORE)}", RED,
+                                         float(x), float(y), now_ms)
+                for arr in self._t_cols:
+                    arr[:new_n] = arr[:n][alive]
+                self.n_targets = new_n
+                self._rebuild_grid()
+                n = new_n
+        if n:
+            age = now_ms - self.t_spawn[:n]  # integer ms, no FP drift
+            progress = np.clip(age / self.t_life[:n], 0.0, 1.0)
+            self._render_progress = progress
+            self._render_alpha = np.clip(
+                255 - (progress * 255).astype(np.int32), 30, 255)
+        else:
+            self._render_progress = self._render_progress[:0]
+            self._render_alpha = self._render_alpha[:0]
 
         # End round
         if ROUND_TIME is not None and self.elapsed >= ROUND_TIME:
             self.best_score = max(self.best_score, self.score)
             self.playing = False
-
-    def spawn_target(self, now):
-        r = random.uniform(TARGET_MIN_RADIUS, TARGET_MAX_RADIUS)
-        x = random.uniform(r + 8, WIDTH - r - 8)
-        y = random.uniform(r + 8 + 40, HEIGHT - r - 8)  # leave space for HUD
-        life = TARGET_LIFETIME * random.uniform(0.85, 1.15)
-        self.targets.append(Target(x, y, r, now, life))
-
-    def handle_click(self, pos, now):
+            # a clean end screen: drop in-flight popups before it freezes
+            self.floating_texts.clear()
+            self._idle_frame = None
+
+    def _rand(self):
+        """Next uniform [0, 1) float from the pre-generated pool."""
+        i = self._rand_idx
+        if i >= len(self._rand_pool):
+            self._rand_pool = self._rng.random(4096)
+            i = 0
+        self._rand_idx = i + 1
+        return float(self._rand_pool[i])
+
+    def spawn_target(self, now_ms):
+        u1, u2, u3, u4 = self._rand(), self._rand(), self._rand(), self._rand()
+        # integer radius so the sprite atlas always has an exact match
+        r = TARGET_MIN_RADIUS + int(u1 * (TARGET_MAX_RADIUS - TARGET_MIN_RADIUS + 1))
+        x = (r + 8) + u2 * (WIDTH - 2 * r - 16)
+        y = (r + 8 + 40) + u3 * (HEIGHT - 2 * r - 56)  # leave space for HUD
+        life_ms = int(TARGET_LIFETIME * 1000 * (0.85 + 0.30 * u4))
+        i = self.n_targets
+        self.tx[i] = x
+        self.ty[i] = y
+        self.tr[i] = r
+        self.t_spawn[i] = now_ms
+        self.t_life[i] = life_ms
+        self.t_r2[i] = (r * r) * RING_FRACS_SQ
+        self.n_targets = i + 1
+        self._grid.setdefault(
+            (int(x) // GRID_CELL, int(y) // GRID_CELL), []).append(i)
+
+    def _rebuild_grid(self):
+        """Re-bucket the live slots; compaction/removal invalidates indices."""
+        self._grid.clear()
+        setdefault = self._grid.setdefault
+        for i in range(self.n_targets):
+            cell = (int(self.tx[i]) // GRID_CELL, int(self.ty[i]) // GRID_CELL)
+            setdefault(cell, []).append(i)
+
+    def handle_click(self, pos, now_ms):
+        # any click changes the scene (new round, hit or miss popup)
+        self._idle_frame = None
         if not self.playing:
-            self.start_round(now)
+            self.start_round(now_ms)
             return
 
         mx, my = pos
 
-        # Find the closest hit target, if any, and which ring it belongs to
+        # Find the closest hit target, if any, and which ring it belongs to.
+        # The spatial hash narrows the vectorized test to the clicked cell
+        # plus its 8 neighbors; a hit can only come from those buckets.
+        n = self.n_targets
         hit_index = -1
-        closest_d2 = 1e12
         ring_idx_for_hit = None
-
-        for i, t in enumerate(self.targets):
-            dx = mx - t.x
-            dy = my - t.y
-            d2 = dx * dx + dy * dy
-
-            # inside outer ring?
-            if d2 <= (t.r * RING_FRACS[-1]) ** 2:
-                if d2 < closest_d2:
-                    closest_d2 = d2
-                    hit_index = i
-
-                    if d2 <= (t.r * RING_FRACS[0]) ** 2:
-                        ring_idx_for_hit = 0  # bullseye
-                    elif d2 <= (t.r * RING_FRACS[1]) ** 2:
-                        ring_idx_for_hit = 1  # middle
-                    else:
-                        ring_idx_for_hit = 2  # outer
+        cand: List[int] = []
+        if n:
+            ccx = int(mx) // GRID_CELL
+            ccy = int(my) // GRID_CELL
+            grid_get = self._grid.get
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cand += grid_get((ccx + dx, ccy + dy), ())
+        if cand:
+            hit_index, ring = find_hit(self.tx, self.ty, self.t_r2,
+                                       np.asarray(cand, dtype=np.int64),
+                                       mx, my)
+            hit_index = int(hit_index)
+            if hit_index >= 0:
+                ring_idx_for_hit = int(ring)
 
         if hit_index >= 0 and ring_idx_for_hit is not None:
-            t = self.targets.pop(hit_index)
+            hx = float(self.tx[hit_index])
+            hy = float(self.ty[hit_index])
+            # swap-remove: move the last live slot into the freed one
+            last = n - 1
+            for arr in self._t_cols:
+                arr[hit_index] = arr[last]
+            self.n_targets = last
+            self._rebuild_grid()
+
             award = RING_SCORES[ring_idx_for_hit]
             self.score += award
             self.hits += 1
@@ -214,60 +455,87 @@ class Game:
             else:
                 color = WHITE
 
-            self.make_float_text(f"+{award}", color, t.x, t.y, now)
+            self.make_float_text(f"+{award}", color, hx, hy, now_ms)
         else:
             # Miss (clicked outside all targets)
             self.score += MISS_SCORE
             self.misses += 1
-            self.make_float_text(str(MISS_SCORE), RED, mx, my, now)
+            self.make_float_text(str(MISS_SCORE), RED, mx, my, now_ms)
 
-    def make_float_text(self, text, color, x, y, now):
-        self.floating_texts.append((text, color, x, y, now))
+    def make_float_text(self, text, color, x, y, now_ms):
+        self.floating_texts.append((text, color, x, y, now_ms))
 
     # -------------------------
     # Rendering
     # -------------------------
-    def draw(self, now):
-        """Draw the scene (target, HUD, overlay, crosshair, etc.)"""
-        self.screen.fill(BG)
-
-        # Targets (bullseye look + timeout arc)
-        for t in self.targets:
-            age = now - t.spawn_time
-            alpha = clamp(255 - int((age / t.lifetime) * 255), 30, 255)
-            pygame.draw.circle(self.screen, WHITE, (int(t.x), int(t.y)), int(t.r), 2)
-            inner_r = int(t.r * 0.55)
-            pygame.draw.circle(self.screen, CYAN, (int(t.x), int(t.y)), inner_r, 2)
-            core_r = int(t.r * 0.25)
-            pygame.draw.circle(self.screen, WHITE, (int(t.x), int(t.y)), core_r, 0)
-            progress = clamp((now - t.spawn_time) / t.lifetime, 0, 1.0)
-            end_angle = -math.pi/2 + 2 * math.pi * progress
-            pygame.draw.arc(
-                self.screen,
-                (alpha, 80, 80),
-                (t.x - t.r - 2, t.y - t.r - 2, (t.r + 2) * 2, (t.r + 2) * 2),
-                -math.pi/2,
-                end_angle,
-                3
-            )
+    def draw(self, now_ms):
+        """Draw the scene (target, HUD, overlay, crosshair, etc.)
+
+        Only regions touched last frame are erased (blitted back from the
+        static background) and only regions touched this frame are queued
+        for display.update in `run`.
+        """
+        dirty: List[pygame.Rect] = []
+        if self._cross_rect is not None:
+            self.screen.blit(self.background, self._cross_rect, self._cross_rect)
+        for rect in self.prev_dirty:
+            self.screen.blit(self.background, rect, rect)
+
+        # Targets: pre-rendered bullseye sprite + dynamic timeout arc
+        for i in range(self.n_targets):
+            x = float(self.tx[i])
+            y = float(self.ty[i])
+            r = float(self.tr[i])
+            spr = self._target_sprites[int(r)]
+            half = spr.get_width() // 2
+            self.screen.blit(spr, (int(x) - half, int(y) - half))
+            # bbox covers the rings plus the timeout arc (r + 2, width 3)
+            pad = int(r) + 6
+            dirty.append(pygame.Rect(int(x) - pad, int(y) - pad, 2 * pad, 2 * pad))
+
+            k = min(int(float(self._render_progress[i]) * ARC_FRAMES),
+                    ARC_FRAMES - 1)
+            arc = self._arc_atlas[int(r)][k]
+            arc.set_alpha(int(self._render_alpha[i]))
+            half = arc.get_width() // 2
+            self.screen.blit(arc, (int(x) - half, int(y) - half))
         if self.paused:
-            tip_s = self.font_big.render("PAUSED", True, YELLOW)
-            self.screen.blit(tip_s, ((WIDTH - tip_s.get_width()) // 2, HEIGHT // 2 - 20))
-
-        # Floating texts
-        ft_alive = []
-        for text, color, x, y, birth in self.floating_texts:
-            age = now - birth
-            if age < 0.7:
-                dy = -40 * age
-                surf = self.font_med.render(text, True, color)
-                self.screen.blit(surf, (x - surf.get_width() // 2, y + dy))
-                ft_alive.append((text, color, x, y, birth))
-        self.floating_texts = ft_alive
-
-        # HUD bar
-        pygame.draw.rect(self.screen, (20, 24, 32), (0, 0, WIDTH, 36))
-        pygame.draw.line(self.screen, (40, 46, 58), (0, 36), (WIDTH, 36), 1)
+            tip_s = self._text(self.font_big, "PAUSED", YELLOW)
+            pos = ((WIDTH - tip_s.get_width()) // 2, HEIGHT // 2 - 20)
+            dirty.append(self.screen.blit(tip_s, pos))
+
+        # Floating texts: bind hot attributes to locals once, cull + render
+        # in a single pass and reassign the alive list at the end
+        if self.floating_texts:
+            float_cache = self._float_cache
+            text_surf = self._text
+            font_med = self.font_med
+            dirty_append = dirty.append
+            ft_alive = []
+            ft_append = ft_alive.append
+            ft_blits = []
+            ft_blit_append = ft_blits.append
+            for entry in self.floating_texts:
+                text, color, x, y, birth_ms = entry
+                age_ms = now_ms - birth_ms
+                if age_ms >= 700:
+                    continue
+                surf = float_cache.get((text, color))
+                if surf is None:  # unexpected string; render through the cache
+                    surf = text_surf(font_med, text, color)
+                px = int(x) - surf.get_width() // 2
+                py = int(y - 0.04 * age_ms)
+                ft_blit_append((surf, (px, py)))
+                dirty_append(pygame.Rect(
+                    px, py, surf.get_width(), surf.get_height()))
+                ft_append(entry)
+            if ft_blits:
+                self._blit_batch(ft_blits)
+            self.floating_texts = ft_alive
+
+        # HUD bar chrome lives in the background; only the text is drawn
+        # here, but the whole bar stays dirty so stale text gets erased
+        dirty.append(pygame.Rect(0, 0, WIDTH, 37))
 
         acc = (self.hits / max(1, (self.hits + self.misses))) * 100.0
         hud_items = [
@@ -278,16 +546,18 @@ class Game:
             f"Acc: {acc:.1f}%",
         ]
         if ROUND_TIME is not None and self.playing:
-            time_left = max(0, int(ROUND_TIME - (now - self.start_time)))
+            time_left = max(0, int(ROUND_TIME - (now_ms - self.start_time_ms) * 0.001))
             hud_items.append(f"Time: {time_left}s")
         elif ROUND_TIME is not None and not self.playing:
             hud_items.append("Time: 0s")
 
         x = 10
+        hud_blits = []
         for item in hud_items:
-            surf = self.font_small.render(item, True, WHITE)
-            self.screen.blit(surf, (x, 9))
+            surf = self._text(self.font_small, item, WHITE)
+            hud_blits.append((surf, (x, 9)))
             x += surf.get_width() + 18
+        self._blit_batch(hud_blits)
 
         # Start / end overlays
         if not self.playing:
@@ -299,30 +569,44 @@ class Game:
                 title = "SHOOTING"
                 sub = "Click to start. Hit targets +10, Miss -5, Timeout -3."
                 tip = "ESC: quit   |   R: reset best"
-            title_s = self.font_big.render(title, True, WHITE)
-            sub_s = self.font_med.render(sub, True, MUTED)
-            tip_s = self.font_small.render(tip, True, MUTED)
-            self.screen.blit(title_s, ((WIDTH - title_s.get_width()) // 2, HEIGHT // 2 - 64))
-            self.screen.blit(sub_s, ((WIDTH - sub_s.get_width()) // 2, HEIGHT // 2 - 16))
-            self.screen.blit(tip_s, ((WIDTH - tip_s.get_width()) // 2, HEIGHT // 2 + 20))
+            title_s = self._text(self.font_big, title, WHITE)
+            sub_s = self._text(self.font_med, sub, MUTED)
+            tip_s = self._text(self.font_small, tip, MUTED)
+            dirty.append(self.screen.blit(
+                title_s, ((WIDTH - title_s.get_width()) // 2, HEIGHT // 2 - 64)))
+            dirty.append(self.screen.blit(
+                sub_s, ((WIDTH - sub_s.get_width()) // 2, HEIGHT // 2 - 16)))
+            dirty.append(self.screen.blit(
+                tip_s, ((WIDTH - tip_s.get_width()) // 2, HEIGHT // 2 + 20)))
+
+        # Idle scenes (pause / start / round-over) are static: snapshot the
+        # frame before the crosshair goes on so run() can skip full redraws
+        if self.paused or not self.playing:
+            if self._idle_frame is None:
+                self._idle_frame = self.screen.copy()
+        else:
+            self._idle_frame = None
 
         # Crosshair
         mx, my = pygame.mouse.get_pos()
-        self.draw_crosshair(mx, my)
+        old_cross = self._cross_rect
+        new_cross = self.draw_crosshair(mx, my)
+
+        # Update the erased (previous) and freshly drawn regions
+        self._update_rects = self.prev_dirty + dirty + [new_cross]
+        if old_cross is not None:
+            self._update_rects.append(old_cross)
+        self.prev_dirty = dirty
+        self._cross_rect = new_cross
 
     def draw_crosshair(self, mx, my):
         r = self.crosshair_radius
-        g = self.crosshair_gap
-        pygame.draw.line(self.screen, YELLOW, (mx - r, my), (mx - g, my), 2)
-        pygame.draw.line(self.screen, YELLOW, (mx + g, my), (mx + r, my), 2)
-        pygame.draw.line(self.screen, YELLOW, (mx, my - r), (mx, my - g), 2)
-        pygame.draw.line(self.screen, YELLOW, (mx, my + g), (mx, my + r), 2)
-        pygame.draw.circle(self.screen, YELLOW, (mx, my), 2)
+        return self.screen.blit(self.crosshair_surf, (mx - r - 2, my - r - 2))
 
     # -------------------------
     # Event handling
     # -------------------------
-    def handle_events(self, now):
+    def handle_events(self, now_ms):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -331,29 +615,57 @@ class Game:
                     self.running = False
                 elif event.key == pygame.K_r:
                     self.best_score = 0
+                    self._idle_frame = None
                 elif event.key == pygame.K_p and self.playing:
                     self.paused = not self.paused
+                    self._idle_frame = None
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                self.handle_click(event.pos, now)
+                self.handle_click(event.pos, now_ms)
 
     # -------------------------
     # Main run
     # -------------------------
     def run(self):
         pygame.mouse.set_visible(False)
+        sim_accum = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
-            now = pygame.time.get_ticks() / 1000.0
-            self.handle_events(now)
-            self.update(dt, now)
-            self.draw(now)
-            pygame.display.flip()
+            idle = self.paused or not self.playing
+            dt = self.clock.tick(30 if idle else RENDER_FPS) / 1000.0
+            now_ms = pygame.time.get_ticks()
+            self.handle_events(now_ms)
+
+            # Idle fast path: the scene snapshot is still valid, so only
+            # the crosshair needs to move
+            if (self.paused or not self.playing) and self._idle_frame is not None:
+                rects = []
+                if self._cross_rect is not None:
+                    self.screen.blit(self._idle_frame,
+                                     self._cross_rect, self._cross_rect)
+                    rects.append(self._cross_rect)
+                mx, my = pygame.mouse.get_pos()
+                self._cross_rect = self.draw_crosshair(mx, my)
+                rects.append(self._cross_rect)
+                pygame.display.update(rects)
+                continue
+
+            # Fixed-step simulation: render frames may be slower or faster,
+            # the game logic always advances in SIM_DT slices
+            sim_accum = min(sim_accum + dt, 0.25)  # cap to avoid spiraling
+            while sim_accum >= SIM_DT:
+                self.update(SIM_DT, now_ms)
+                sim_accum -= SIM_DT
+            self.draw(now_ms)
+            pygame.display.update(self._update_rects)
         pygame.mouse.set_visible(True)
 
 def main():
     pygame.init()
     pygame.display.set_caption("SHOOTING - COMP9001")
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    try:
+        # best effort: lets the driver pace flips instead of busy-waiting
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), vsync=1)
+    except (TypeError, pygame.error):
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
     try:
         Game(screen).run()
     finally: